@@ -220,6 +220,12 @@ class OncePickledObject:
     only intended to be used when users know the object will be pickled and
     unpickled exactly once before use.
 
+    The wrapped object is always pickled with `pickle.HIGHEST_PROTOCOL`,
+    regardless of the protocol requested by the pickler that pickles the
+    wrapper. The inner pickle is just an opaque bytestring to that outer
+    pickler, so the two don't need to match. The chosen ``dumps`` must accept a
+    ``protocol`` keyword argument and support that protocol.
+
     >>> opo123 = OncePickledObject(123, pickle.dumps, pickle.loads)
     >>> opo123
     <pyrseus.core.pickle.OncePickledObject object at ...>
@@ -234,8 +240,10 @@ class OncePickledObject:
 
     def __reduce_ex__(self, protocol: int):
         # Pickle the object we're wrapping, using the chosen pickler, returning
-        # a bytestring.
-        pickled = self._dumps(self._obj, protocol=protocol)
+        # a bytestring. The bytestring is opaque to the calling pickler, so we
+        # don't need to match its protocol. Use the highest one since it's the
+        # most efficient, e.g. for large buffers.
+        pickled = self._dumps(self._obj, protocol=pickle.HIGHEST_PROTOCOL)
         # Tell the pickler that's calling us that it can reconstruct the
         # original unwrapped object by calling the chosen unpickler on the
         # bytestring created from the original object we wrapped.
@@ -277,7 +285,10 @@ class CustomPickledClosure:
 
         :param dumps: a `pickle.dumps`-like function that will be used for
             serializing the closure contents when this wrapper is pickled. This
-            function must accept a ``protocol`` keyword argument.
+            function must accept a ``protocol`` keyword argument. Like with
+            `.OncePickledObject`, it's always called with
+            `pickle.HIGHEST_PROTOCOL`, regardless of the protocol requested by
+            the pickler that pickles this wrapper.
 
         :param loads: a `pickle.loads`-like function that will be used for
             deserializing the closure contents when the pickled form of this
@@ -296,9 +307,12 @@ class CustomPickledClosure:
         # with pickle.dumps itself.
         pickled_loads = pickle.dumps(self._loads, protocol=protocol)
         # Now pickle up the whole closure, using the requested serializer. For
-        # efficiency, we don't re-serialize self._loads
+        # efficiency, we don't re-serialize self._loads. Like in
+        # OncePickledObject, the result is opaque to the calling pickler, so we
+        # use the highest protocol instead of the calling pickler's, which is
+        # often an older default (e.g. with multiprocessing).
         args = [self._func, self._args, self._kwargs, self._dumps]
-        dumped_args = self._dumps(args, protocol=protocol)
+        dumped_args = self._dumps(args, protocol=pickle.HIGHEST_PROTOCOL)
         # This instructs the unpickler to use our special factory that undoes
         # the extra nested pickling.
         return type(self)._hydrate, (pickled_loads, dumped_args)
@@ -14,7 +14,18 @@ from enum import auto
 from functools import cached_property
 from inspect import Parameter, signature
 from types import TracebackType
-from typing import Callable, List, Optional, Protocol, Set, Tuple, Type, Union
+from typing import (
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 try:
     from enum import StrEnum as _StrishEnum  # >= py 3.11
@@ -130,62 +141,105 @@ def extract_keywords(factory: Callable) -> Set[str]:
         under the assumption that all subclass ``**kwargs`` get passed without
         name changes to the superclass.
     """
+    if not isinstance(factory, type):
+        return set(_extract_mro_keywords([factory]))
+    try:
+        kwarg_names = _CLASS_KEYWORDS.get(factory)
+    except TypeError:
+        # Unhashable class (e.g. from a metaclass with __hash__ = None), so it
+        # can't be cached.
+        return set(_extract_mro_keywords(factory.__mro__))
+    if kwarg_names is None:
+        kwarg_names = _extract_mro_keywords(factory.__mro__)
+        _CLASS_KEYWORDS[factory] = kwarg_names
+    # Callers get their own mutable copy of the cached result.
+    return set(kwarg_names)
+
+
+_CLASS_KEYWORDS: WeakKeyDictionary[type, FrozenSet[str]] = WeakKeyDictionary()
+"""
+Cache of `.extract_keywords` results for classes. It's keyed on the class that
+was passed in, so it only speeds up repeated lookups of that same class: a new
+subclass still walks its whole MRO, including any shared bases. It has weak keys
+so that it doesn't keep short-lived classes alive.
+"""
+
+
+def _extract_mro_keywords(funcs) -> FrozenSet[str]:
+    """
+    Helper for `.extract_keywords` that accumulates the keywords of ``funcs``,
+    a factory function or a class' MRO, until one of them doesn't take a
+    variadic ``**kwargs``-style argument.
+    """
     kwarg_names = set()
-    if isinstance(factory, type):
-        funcs = factory.__mro__
-    else:
-        funcs = [factory]
     for func in funcs:
         if isinstance(func, type) and ("__init__" not in func.__dict__):
             # Skip mixins.
             continue
-        saw_kwargs = False
-        sig = signature(func)
-        max_workers_idx = 0
-        for i, (name, spec) in enumerate(sig.parameters.items()):
-            if i == max_workers_idx:
-                if spec.kind not in (
-                    Parameter.POSITIONAL_ONLY,
-                    Parameter.POSITIONAL_OR_KEYWORD,
-                ):
-                    raise TypeError(
-                        f"The factory's first (non-self) parameter must "
-                        f"be positional (and be for a max_workers argument).\n"
-                        f"    factory:         {func}\n"
-                        f"    parameter index: {i}\n"
-                        f"    parameter name:  {name}\n"
-                        f"    parameter kind:  {spec.kind}\n"
-                    )
-                if name == "self":
-                    max_workers_idx = 1
-                elif name == "max_workers":
-                    pass
-                else:
-                    # For now, we'll be fussy about names for simplicity.
-                    raise TypeError(
-                        "The factory's first (non-self) parameter must "
-                        "be named 'max_workers'."
-                    )
-            elif spec.kind == Parameter.POSITIONAL_ONLY:
+        own_kwarg_names, saw_kwargs = _extract_own_keywords(func)
+        kwarg_names |= own_kwarg_names
+        if not saw_kwargs:
+            # This function or class doesn't pass anything through to its
+            # superclasses, so stop walking the mro as soon as we see it.
+            break
+    return frozenset(kwarg_names)
+
+
+def _extract_own_keywords(func: Callable) -> Tuple[FrozenSet[str], bool]:
+    """
+    Helper for `.extract_keywords` that validates a single function's or
+    class' call signature, without walking its MRO.
+
+    :return: the keyword argument names it accepts (other than ``self`` and
+        ``max_workers``), and whether it takes a variadic ``**kwargs``-style
+        argument.
+    """
+    kwarg_names = set()
+    saw_kwargs = False
+    sig = signature(func)
+    max_workers_idx = 0
+    for i, (name, spec) in enumerate(sig.parameters.items()):
+        if i == max_workers_idx:
+            if spec.kind not in (
+                Parameter.POSITIONAL_ONLY,
+                Parameter.POSITIONAL_OR_KEYWORD,
+            ):
                 raise TypeError(
-                    "The only allowed positional-only (non-self) parameter for "
-                    "a factory is 'max_workers'."
+                    f"The factory's first (non-self) parameter must "
+                    f"be positional (and be for a max_workers argument).\n"
+                    f"    factory:         {func}\n"
+                    f"    parameter index: {i}\n"
+                    f"    parameter name:  {name}\n"
+                    f"    parameter kind:  {spec.kind}\n"
                 )
-            elif spec.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
-                if spec.default is Parameter.empty:
-                    raise TypeError(f"Parameter {name!r} has no default.")
-                kwarg_names.add(name)
-            elif spec.kind is Parameter.VAR_POSITIONAL:
-                raise TypeError(f"Factories must not take *args-style varargs: {func}")
-            elif spec.kind is Parameter.VAR_KEYWORD:
-                # We've seen variadic kwargs, so if we're chasing the mro graph,
-                # we need to keep going.
-                saw_kwargs = True
+            if name == "self":
+                max_workers_idx = 1
+            elif name == "max_workers":
+                pass
             else:
-                raise TypeError(f"Unknown factory parameter kind: {spec.kind}")
-        if not saw_kwargs:
-            break
-    return kwarg_names
+                # For now, we'll be fussy about names for simplicity.
+                raise TypeError(
+                    "The factory's first (non-self) parameter must "
+                    "be named 'max_workers'."
+                )
+        elif spec.kind == Parameter.POSITIONAL_ONLY:
+            raise TypeError(
+                "The only allowed positional-only (non-self) parameter for "
+                "a factory is 'max_workers'."
+            )
+        elif spec.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
+            if spec.default is Parameter.empty:
+                raise TypeError(f"Parameter {name!r} has no default.")
+            kwarg_names.add(name)
+        elif spec.kind is Parameter.VAR_POSITIONAL:
+            raise TypeError(f"Factories must not take *args-style varargs: {func}")
+        elif spec.kind is Parameter.VAR_KEYWORD:
+            # We've seen variadic kwargs, so if we're chasing the mro graph,
+            # we need to keep going.
+            saw_kwargs = True
+        else:
+            raise TypeError(f"Unknown factory parameter kind: {spec.kind}")
+    return frozenset(kwarg_names), saw_kwargs
 
 
 class ExecutorPluginEntryPoint(Protocol):
@@ -3,23 +3,53 @@ Verifies that `.CpProcessPoolExecutor` handles all of its ``on_error`` modes
 correctly.
 """
 
+import multiprocessing
 import os
-import platform
-import signal
 import sys
+import threading
 import time
+from contextlib import contextmanager
 from concurrent.futures import CancelledError, TimeoutError
 from concurrent.futures.process import EXTRA_QUEUED_CALLS
-from multiprocessing import Manager
 
 import pytest
-from pyrseus.core.sys import SignalHandlerCtx
 from pyrseus.ctx.mgr import ExecutorCtx
 
-# These tests rely on SIGALRM. Unfortunately, that doesn't exist on Windows.
-pytestmark = pytest.mark.skipif(
-    platform.system() == "Windows", reason="SIGALRM does not exist on Windows"
-)
+RELEASE_DELAY_SECS = 0.05
+"""
+How long after submitting its tasks each test waits before letting them finish.
+This only needs to be long enough for the test to have started exiting the
+context while the tasks are still blocked.
+"""
+
+TASK_TIMEOUT_SECS = 5
+"""
+Upper bound on how long a task waits to be released, so that a broken test fails
+instead of deadlocking.
+"""
+
+NUM_PREQUEUED = 1 + EXTRA_QUEUED_CALLS
+"""
+How many tasks a 1-worker ProcessPoolExecutor moves into its call queue. Tasks
+there can't be cancelled anymore.
+"""
+
+NUM_TASKS = 1 + NUM_PREQUEUED + 1
+"""
+One really running task, a full call queue, and one really not started task.
+"""
+
+MP_CONTEXT = multiprocessing.get_context()
+"""
+Used both for the synchronization primitives and the worker processes, so that
+the workers can inherit the former.
+"""
+
+_WORKER_STARTED = None
+_WORKER_EVENTS = None
+"""
+Set by `init_worker_events` in each worker process.
+"""
 
 
 def get_abbrev_state(fut):
@@ -49,6 +79,92 @@ def get_abbrev_state(fut):
     }[run, cancelled, done, has_exc]
 
 
+def init_worker_events(started, events):
+    """
+    Worker initializer. Multiprocessing synchronization primitives can only be
+    shared through inheritance, so they can't be task arguments.
+    """
+    global _WORKER_STARTED, _WORKER_EVENTS
+    _WORKER_STARTED = started
+    _WORKER_EVENTS = events
+
+
+def wait_for_release(i):
+    """
+    Task function that tells the test it has started, then blocks until the
+    test releases it by setting event ``i``.
+    """
+    _WORKER_STARTED.set()
+    return _WORKER_EVENTS[i].wait(TASK_TIMEOUT_SECS)
+
+
+def create_ctx_and_events(on_error):
+    """
+    Creates an un-entered `.ExecutorCtx` whose worker shares a "started" event
+    and one release event per task with this process.
+    """
+    started = MP_CONTEXT.Event()
+    events = [MP_CONTEXT.Event() for _ in range(NUM_TASKS)]
+    ctx = ExecutorCtx(
+        "cpprocess",
+        1,
+        on_error=on_error,
+        mp_context=MP_CONTEXT,
+        initializer=init_worker_events,
+        initargs=(started, events),
+    )
+    return ctx, started, events
+
+
+def submit_blocked_tasks(exe, started):
+    """
+    Submits one task that is really running on the (only) worker, enough tasks
+    to fill the executor's call queue behind it, and one really not started
+    task. Returns their futures.
+
+    Unlike the submission itself, the return only happens once the executor has
+    settled into that state, so that the tests don't depend on the timing of
+    ProcessPoolExecutor's queue management thread.
+    """
+    futs = [exe.submit(wait_for_release, 0)]
+    assert started.wait(TASK_TIMEOUT_SECS)
+    for i in range(1, NUM_TASKS):
+        futs.append(exe.submit(wait_for_release, i))
+    deadline = time.monotonic() + TASK_TIMEOUT_SECS
+    while not all(fut.running() for fut in futs[:-1]):
+        assert time.monotonic() < deadline, "The call queue never filled."
+        time.sleep(0.001)
+    assert not futs[-1].running()
+    return futs
+
+
+@contextmanager
+def ReleaseTimerCtx(events):
+    """
+    Creates a timer that sets the given ``events`` `RELEASE_DELAY_SECS` after
+    it's started. The timer is cancelled on exit, so that it can't fire during
+    or after teardown if the test fails before the events are set.
+    """
+    timer = threading.Timer(RELEASE_DELAY_SECS, lambda: [e.set() for e in events])
+    try:
+        yield timer
+    finally:
+        timer.cancel()
+
+
+def assert_released(fut):
+    """
+    Verifies that ``fut`` completed because the test set its event, not because
+    its wait timed out.
+    """
+    state = get_abbrev_state(fut)
+    if state == "exception":
+        exc = RuntimeError("Unexpected task exception")
+        raise exc from fut.exception()
+    assert state == "success"
+    assert fut.result() is True
+
+
 @pytest.mark.parametrize("on_error", ("wait", "cancel", "kill"))
 def test_always_wait_if_no_error(on_error):
     """
@@ -61,57 +177,36 @@ def test_always_wait_if_no_error(on_error):
     # can't be cancelled.
     assert 0 <= EXTRA_QUEUED_CALLS < 2
 
-    # Called asynchronously 1s after all futures have been submitted.
-    def release_barriers_on_sigalrm(signum, frame):
-        assert signum == signal.SIGALRM
-        # Verify that exactly 1 task is really running and is now waiting on our
-        # barrier.
-        for i, barrier in enumerate(barriers):
-            if i == 0:
-                assert barrier.n_waiting == 1
-            else:
-                assert barrier.n_waiting == 0
-        # Meet each task at our barrier. We include a small scheduling timeout.
-        for barrier in barriers:
-            barrier.wait(0.1)
-
-    # Submit some tasks that wait on a 1s alarm timer before being allowed to
-    # proceed. While the timer is waiting, start exiting the context. Verify
-    # that (a) ctx.__exit__ blocks until all futs are done, but (b) it's
-    # otherwise running pretty quickly [otherwise we have to doubt our min
-    # bound].
-    with Manager() as sync_mgr:
-        ctx = ExecutorCtx("cpprocess", 1, on_error=on_error)
-        with SignalHandlerCtx(signal.SIGALRM, release_barriers_on_sigalrm):
-            try:
-                exe = ctx.__enter__()
-                assert exe.submit(os.getpid).result() != os.getpid()  # warm up
-                # Create one really-started task, fill the rest of the task
-                # pre-queue, and create one really not started task.
-                barriers = []
-                futs = []
-                for _ in range(1 + EXTRA_QUEUED_CALLS + 1):
-                    barriers.append(sync_mgr.Barrier(2))
-                    futs.append(exe.submit(barriers[-1].wait))
-                t0 = time.time()
-                signal.alarm(1)
-            except:  # NOQA
-                exc_info = sys.exc_info()
-                ctx.__exit__(*exc_info)
-                raise AssertionError("Exception not expected") from exc_info[1]
-            else:
-                ctx.__exit__(None, None, None)
-            t1 = time.time()
-            for fut in futs:
-                state = get_abbrev_state(fut)
-                if state == "exception":
-                    exc = RuntimeError("Unexpected task exception")
-                    raise exc from fut.exception()
-                else:
-                    assert state == "success"
-            elapsed_secs = t1 - t0
-            # Should block on the 1s alarm, but then finish all tasks quickly.
-            assert 1.0 <= elapsed_secs <= 1.3
+    # Submit some tasks that each block on their own event. Shortly after they
+    # have all been submitted, a timer thread sets those events. Meanwhile,
+    # start exiting the context. Verify that (a) ctx.__exit__ blocks until all
+    # futs are done, but (b) it's otherwise running pretty quickly [otherwise
+    # we have to doubt our min bound].
+    ctx, started, events = create_ctx_and_events(on_error)
+    with ReleaseTimerCtx(events) as timer:
+        try:
+            exe = ctx.__enter__()
+            # Warm up. This keeps the worker's startup out of the timed window,
+            # including any imports (with the spawn start method, unpickling
+            # init_worker_events already imports this module and pyrseus).
+            assert exe.submit(os.getpid).result() != os.getpid()
+            # Create one really-started task, fill the call queue, and create
+            # one really not started task.
+            futs = submit_blocked_tasks(exe, started)
+            t0 = time.monotonic()
+            timer.start()
+        except:  # NOQA
+            exc_info = sys.exc_info()
+            ctx.__exit__(*exc_info)
+            raise AssertionError("Exception not expected") from exc_info[1]
+        else:
+            ctx.__exit__(None, None, None)
+    t1 = time.monotonic()
+    for fut in futs:
+        assert_released(fut)
+    elapsed_secs = t1 - t0
+    # Should block on the timer, but then finish all tasks quickly.
+    assert RELEASE_DELAY_SECS <= elapsed_secs <= RELEASE_DELAY_SECS + 0.25
 
 
 def test_wait_on_error():
@@ -121,54 +216,32 @@ def test_wait_on_error():
     """
 
     # This is similar to test_always_wait_if_no_error, except we raise an
-    # exception right after we start releasing the barriers. Like it, this
-    # should wait till all tasks are done. For clarity, the only other comments
-    # in this test function are ones that highlight which lines differ from
+    # exception right after we start the release timer. Like it, this should
+    # wait till all tasks are done. For clarity, the only other comments in
+    # this test function are ones that highlight which lines differ from
     # test_always_wait_if_no_error's.
 
     assert 0 <= EXTRA_QUEUED_CALLS < 2
 
-    def release_barriers_on_sigalrm(signum, frame):
-        assert signum == signal.SIGALRM
-        for i, barrier in enumerate(barriers):
-            if i == 0:
-                assert barrier.n_waiting == 1
-            else:
-                assert barrier.n_waiting == 0
-        for barrier in barriers:
-            barrier.wait(0.1)
-
-    with Manager() as sync_mgr:
-        ctx = ExecutorCtx("cpprocess", 1, on_error="wait")  # <--------- DIFFERS
-        with SignalHandlerCtx(signal.SIGALRM, release_barriers_on_sigalrm):
-            try:
-                exe = ctx.__enter__()
-                assert exe.submit(os.getpid).result() != os.getpid()
-                barriers = []
-                futs = []
-                for _ in range(1 + EXTRA_QUEUED_CALLS + 1):
-                    barriers.append(sync_mgr.Barrier(2))
-                    futs.append(exe.submit(barriers[-1].wait))
-                t0 = time.time()
-                signal.alarm(1)  # <------------------------------------ DIFFERS
-                exc = RuntimeError("start exiting early")  # <---------- DIFFERS
-                raise exc  # <------------------------------------------ DIFFERS
-            except:  # NOQA
-                exc_info = sys.exc_info()
-                ctx.__exit__(*exc_info)
-                assert exc_info[1] is exc, exc_info[
-                    1
-                ]  # <---------------------------DIFFERS
-            t1 = time.time()
-            for fut in futs:
-                state = get_abbrev_state(fut)
-                if state == "exception":
-                    exc = RuntimeError("Unexpected task exception")
-                    raise exc from fut.exception()
-                else:
-                    assert state == "success"
-            elapsed_secs = t1 - t0
-            assert 1.0 <= elapsed_secs <= 1.3
+    ctx, started, events = create_ctx_and_events("wait")  # <----------- DIFFERS
+    with ReleaseTimerCtx(events) as timer:
+        try:
+            exe = ctx.__enter__()
+            assert exe.submit(os.getpid).result() != os.getpid()
+            futs = submit_blocked_tasks(exe, started)
+            t0 = time.monotonic()
+            timer.start()
+            exc = RuntimeError("start exiting early")  # <-------------- DIFFERS
+            raise exc  # <---------------------------------------------- DIFFERS
+        except:  # NOQA
+            exc_info = sys.exc_info()
+            ctx.__exit__(*exc_info)
+            assert exc_info[1] is exc, exc_info[1]  # <----------------- DIFFERS
+    t1 = time.monotonic()
+    for fut in futs:
+        assert_released(fut)
+    elapsed_secs = t1 - t0
+    assert RELEASE_DELAY_SECS <= elapsed_secs <= RELEASE_DELAY_SECS + 0.25
 
 
 def test_cancel_on_error(on_error="cancel"):
@@ -183,42 +256,27 @@ def test_cancel_on_error(on_error="cancel"):
 
     assert 0 <= EXTRA_QUEUED_CALLS < 2
 
-    def release_barriers_on_sigalrm(signum, frame):
-        assert signum == signal.SIGALRM
-        for i, barrier in enumerate(barriers):
-            if i == 0:
-                assert barrier.n_waiting == 1
-            else:
-                assert barrier.n_waiting == 0
-        for barrier in barriers[: 1 + EXTRA_QUEUED_CALLS]:  # <--------- DIFFERS
-            barrier.wait(0.1)
-
-    with Manager() as sync_mgr:
-        ctx = ExecutorCtx("cpprocess", 1, on_error=on_error)  # <------- DIFFERS
-        with SignalHandlerCtx(signal.SIGALRM, release_barriers_on_sigalrm):
-            try:
-                exe = ctx.__enter__()
-                assert exe.submit(os.getpid).result() != os.getpid()
-                barriers = []
-                futs = []
-                for _ in range(1 + EXTRA_QUEUED_CALLS + 1):
-                    barriers.append(sync_mgr.Barrier(2))
-                    futs.append(exe.submit(barriers[-1].wait))
-                t0 = time.time()
-                signal.alarm(1)
-                exc = RuntimeError("start exiting early")
-                raise exc
-            except:  # NOQA
-                exc_info = sys.exc_info()
-                ctx.__exit__(*exc_info)
-                assert exc_info[1] is exc, exc_info[1]
-            t1 = time.time()
-            for fut in futs[: 1 + EXTRA_QUEUED_CALLS]:  # <------------- DIFFERS
-                assert get_abbrev_state(fut) == "success"  # <---------- DIFFERS
-            for fut in futs[1 + EXTRA_QUEUED_CALLS :]:  # <------------- DIFFERS
-                assert get_abbrev_state(fut) == "cancelled"  # <-------- DIFFERS
-            elapsed_secs = t1 - t0
-            assert 1.0 <= elapsed_secs <= 1.2
+    ctx, started, events = create_ctx_and_events(on_error)  # <--------- DIFFERS
+    with ReleaseTimerCtx(events[:-1]) as timer:  # <-------------------- DIFFERS
+        try:
+            exe = ctx.__enter__()
+            assert exe.submit(os.getpid).result() != os.getpid()
+            futs = submit_blocked_tasks(exe, started)
+            t0 = time.monotonic()
+            timer.start()
+            exc = RuntimeError("start exiting early")
+            raise exc
+        except:  # NOQA
+            exc_info = sys.exc_info()
+            ctx.__exit__(*exc_info)
+            assert exc_info[1] is exc, exc_info[1]
+    t1 = time.monotonic()
+    for fut in futs[:-1]:  # <------------------------------------------ DIFFERS
+        assert_released(fut)  # <--------------------------------------- DIFFERS
+    for fut in futs[-1:]:  # <------------------------------------------ DIFFERS
+        assert get_abbrev_state(fut) == "cancelled"  # <---------------- DIFFERS
+    elapsed_secs = t1 - t0
+    assert RELEASE_DELAY_SECS <= elapsed_secs <= RELEASE_DELAY_SECS + 0.15
 
 
 def test_kill_on_error():
@@ -17,6 +17,7 @@ test successes.
 
 import platform
 import time
+import uuid
 from concurrent.futures import ProcessPoolExecutor
 from functools import cached_property
 
@@ -38,6 +39,21 @@ def sleep01_and_retV():
 EPS = 0.01
 
 
+_ABBREV_STATES = {
+    # Keys are (running, cancelled, done, returned "V") bits, packed into an
+    # int. We only enumerate the combinations we actually expect to see in
+    # these tests.
+    0b0000: "pending",
+    0b1000: "running",
+    0b0100: "cancel_pending",
+    0b0110: "cancelled",
+    0b0011: "success",
+}
+"""
+Lookup table for `get_abbrev_state`.
+"""
+
+
 def get_abbrev_state(fut):
     """
     Summarizes the state of a Future.
@@ -46,32 +62,28 @@ def get_abbrev_state(fut):
     cancelled = fut.cancelled()
     done = fut.done()
     val = None if not done or cancelled else fut.result(0)
-    return {
-        # We only enumerate the combinations we actually expect to see in these
-        # tests.
-        (False, False, False, None): "pending",
-        (True, False, False, None): "running",
-        (False, True, False, None): "cancel_pending",
-        (False, True, True, None): "cancelled",
-        (False, False, True, "V"): "success",
-    }[run, cancelled, done, val]
+    return _ABBREV_STATES[(run << 3) | (cancelled << 2) | (done << 1) | (val == "V")]
 
 
 def summarize_states(futs):
     return {get_abbrev_state(fut) for fut in futs}
 
 
+def _any_unfinished(futs):
+    # Stops probing as soon as it finds one unfinished future.
+    return any(not fut.done() for fut in futs)
+
+
 def wait_for_futs(futs, timeout_secs):
-    t0 = time.time()
-    while time.time() - t0 < timeout_secs:
-        summaries = summarize_states(futs)
-        if len({"pending", "running"} & summaries) == 0:
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < timeout_secs:
+        if not _any_unfinished(futs):
             break
         time.sleep(0.1)
 
 
 @pytest.fixture
-def entry_point_and_futs_list():
+def plugin_name_and_futs_list():
     futs = []
 
     class OurEntryPoint(ExecutorPluginEntryPoint):
@@ -117,55 +129,60 @@ def entry_point_and_futs_list():
 
             return exe, pre_exit
 
-    assert "altshutdown" not in _CONCURRENT_ENTRY_POINTS
-    register_plugin("altshutdown", OurEntryPoint())
-    assert "altshutdown" in _CONCURRENT_ENTRY_POINTS
-    yield OurEntryPoint(), futs
-    del _CONCURRENT_ENTRY_POINTS["altshutdown"]
+    # Use a unique name so that we never collide with another test that shares
+    # this process' global plugin registry.
+    name = f"altshutdown_{uuid.uuid4().hex[:8]}"
+    assert name not in _CONCURRENT_ENTRY_POINTS
+    register_plugin(name, OurEntryPoint())
+    try:
+        assert name in _CONCURRENT_ENTRY_POINTS
+        yield name, futs
+    finally:
+        del _CONCURRENT_ENTRY_POINTS[name]
 
 
-def test_dont_use_new_feature(entry_point_and_futs_list):
-    _, futs = entry_point_and_futs_list
+def test_dont_use_new_feature(plugin_name_and_futs_list):
+    plugin_name, futs = plugin_name_and_futs_list
     # Everything works as usual if we disable the new features.
     with ExecutorCtx(
-        "altshutdown",
+        plugin_name,
         1,
         cancel_futures=False,
         wait=False,
         states_before_shutdown={"running", "pending"},
         states_after_shutdown={"running", "pending"},  # custom shutdown = noop
     ) as exe:
-        t0 = time.time()
+        t0 = time.monotonic()
         for _ in range(10):
             futs.append(exe.submit(sleep01_and_retV))
-    elapsed_secs = time.time() - t0
+    elapsed_secs = time.monotonic() - t0
     assert elapsed_secs >= (0.1 * 10) - EPS  # all of them ran...
     assert summarize_states(futs) == {"success"}  # ...to completion
 
 
-def test_wait_only_does_nothing_new(entry_point_and_futs_list):
-    _, futs = entry_point_and_futs_list
+def test_wait_only_does_nothing_new(plugin_name_and_futs_list):
+    plugin_name, futs = plugin_name_and_futs_list
     # Pre-waiting doesn't accomplish anything new; it just makes the waiting
     # happen in our shutdown callback instead of in
     # ProcessPoolExecutor.__exit__.
     with ExecutorCtx(
-        "altshutdown",
+        plugin_name,
         1,
         cancel_futures=False,  # the default
         wait=True,  # what __exit__ does
         states_before_shutdown={"running", "pending"},
         states_after_shutdown={"success"},  # resolved earlier
     ) as exe:
-        t0 = time.time()
+        t0 = time.monotonic()
         for _ in range(10):
             futs.append(exe.submit(sleep01_and_retV))
-    elapsed_secs = time.time() - t0
+    elapsed_secs = time.monotonic() - t0
     assert elapsed_secs >= (0.1 * 10) - EPS  # all of them ran...
     assert summarize_states(futs) == {"success"}  # ...and are still completed
 
 
-def test_cancel_without_wait_does_funny_stuff(entry_point_and_futs_list):
-    _, futs = entry_point_and_futs_list
+def test_cancel_without_wait_does_funny_stuff(plugin_name_and_futs_list):
+    plugin_name, futs = plugin_name_and_futs_list
     # Cancelling the futures but not waiting does funny things.
     #  - It disables the waiting not just for the explicit shutdown call, but
     #    also permanently disables it for all subsequent calls, including in
@@ -178,17 +195,17 @@ def test_cancel_without_wait_does_funny_stuff(entry_point_and_futs_list):
     # If any of the above-described behavior changes in a future version of
     # Python, we'll need to adjust this test.
     with ExecutorCtx(
-        "altshutdown",
+        plugin_name,
         1,
         cancel_futures=True,  # start cancelling
         wait=False,  # this effectively disables the wait in __exit__
         states_before_shutdown={"running", "pending"},  # running + pending
         states_after_shutdown={"running", "pending"},  # cancels not registered yet
     ) as exe:
-        t0 = time.time()
+        t0 = time.monotonic()
         for _ in range(10):
             futs.append(exe.submit(sleep01_and_retV))
-    elapsed_secs = time.time() - t0
+    elapsed_secs = time.monotonic() - t0
     assert elapsed_secs < 0.1  # exited quickly
     assert summarize_states(futs) == {"running", "pending"}  # exited too fast
     # everything keeps working till all tasks are done, despite exiting the
@@ -197,23 +214,23 @@ def test_cancel_without_wait_does_funny_stuff(entry_point_and_futs_list):
     assert summarize_states(futs) == {"success"}
 
 
-def test_cancel_and_wait_works(entry_point_and_futs_list):
-    _, futs = entry_point_and_futs_list
+def test_cancel_and_wait_works(plugin_name_and_futs_list):
+    plugin_name, futs = plugin_name_and_futs_list
     # Cancelling and waiting in the same shutdown call does what we expect: all
     # running tasks are completed, and all pending ones are  permanently
     # cancelled.
     with ExecutorCtx(
-        "altshutdown",
+        plugin_name,
         1,
         cancel_futures=True,  # start cancelling
         wait=True,  # but wait until all running ones are done
         states_before_shutdown={"running", "pending"},  # running + pending
         states_after_shutdown={"success", "cancelled"},  # cancelling worked
     ) as exe:
-        t0 = time.time()
+        t0 = time.monotonic()
         for _ in range(10):
             futs.append(exe.submit(sleep01_and_retV))
-    t1 = time.time()
+    t1 = time.monotonic()
     assert 0.01 - EPS <= t1 - t0  # at least 1 should have finished
     # before all would have finished, we should have a combination of success
     # and cancel results
@@ -52,6 +52,34 @@ def test_self_okay():
     assert extract_keywords(factory) == {"foo", "bar"}
 
 
+def test_classmethod_okay():
+    class EntryPoint:
+        @classmethod
+        def create(cls, max_workers, *, a=1):
+            pass
+
+    assert extract_keywords(EntryPoint.create) == {"a"}
+
+
+def test_bound_method_okay():
+    class EntryPoint:
+        def create(this, max_workers, *, a=1):
+            pass
+
+    # Binding drops the first parameter, whatever its name is.
+    assert extract_keywords(EntryPoint().create) == {"a"}
+
+
+def test_unhashable_factory_okay():
+    class Factory:
+        __hash__ = None
+
+        def __call__(self, max_workers, *, a=1):
+            pass
+
+    assert extract_keywords(Factory()) == {"a"}
+
+
 class BadBase:
     # Invalid call signature in this base class, but it's okay because one of
     # our subclasses blocks the recursion by not taking a **kwargs arg.
@@ -85,6 +113,13 @@ def test_complex_inheritance():
         extract_keywords(BadBase)
 
 
+def test_repeated_calls_are_independent():
+    # Results are memoized internally, but callers still get their own sets.
+    kw0 = extract_keywords(Concrete)
+    kw0.add("e")
+    assert extract_keywords(Concrete) == {"a", "b", "c", "d"}
+
+
 #
 # Call signature types that we do *not* support.
 #
@@ -2,8 +2,9 @@
 Tests some basic features of `pyrseus.interactive.get_executor`.
 """
 
+import gc
 import os
-import sys
+import weakref
 from threading import get_ident
 
 from pyrseus.ctx.registry import skip_if_unavailable
@@ -14,17 +15,23 @@ def test_can_create_default_serial_exe():
     exe = get_executor(0)
     assert exe.submit(os.getpid).result() == os.getpid()
     assert exe.submit(get_ident).result() == get_ident()
-    # Make sure there are no leaked references. 1 count is from our local
-    # variable. The other count is from the argument to sys.getrefcount.
-    assert sys.getrefcount(exe) == 2
+    # Make sure there are no leaked references: once our local variable is gone,
+    # the executor should be collectable.
+    ref = weakref.ref(exe)
+    del exe
+    gc.collect()
+    assert ref() is None
 
 
 def test_can_create_default_concurrent_exe():
     exe = get_executor(1)
     assert exe.submit(os.getpid).result() != os.getpid()
-    # Make sure there are no leaked references. 1 count is from our local
-    # variable. The other count is from the argument to sys.getrefcount.
-    assert sys.getrefcount(exe) == 2
+    # Make sure there are no leaked references: once our local variable is gone,
+    # the executor should be collectable.
+    ref = weakref.ref(exe)
+    del exe
+    gc.collect()
+    assert ref() is None
 
 
 def test_loky_reuse():
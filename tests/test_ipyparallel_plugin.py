@@ -16,15 +16,30 @@ from pyrseus.ctx.mgr import ExecutorCtx
 from pyrseus.ctx.registry import is_plugin_available
 
 # Magic global variable that skips the whole test module if the plugin isn't
-# installed.
+# installed. With ``pytest -n auto --dist=loadgroup``, the xdist_group keeps
+# this module's tests on one xdist worker, so that the module-scoped
+# ``ipp_client`` fixture only starts its cluster once instead of once per
+# worker.
 #
 # https://docs.pytest.org/en/latest/example/markers.html#scoped-marking
-pytestmark = pytest.mark.skipif(
-    not is_plugin_available("ipyparallel"), reason="ipyparallel is not available"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not is_plugin_available("ipyparallel"), reason="ipyparallel is not available"
+    ),
+    pytest.mark.xdist_group(name="ipyparallel"),
+]
 
 THIS_PROCESS = psutil.Process()
 
+_CHILD_CMDLINES = {}
+"""
+Caches the joined cmdline of each child process that `get_children` reports,
+keyed by its pid and creation time. The tests call `get_children` many times,
+but the children rarely change between calls. Ignored children aren't cached:
+exec keeps the pid and creation time, so a child that was read between its fork
+and exec could still show pytest's own cmdline.
+"""
+
 
 @cache
 def get_worker_id():
@@ -42,19 +57,58 @@ def get_inner_func():
 def get_children():
     ret = set()
     for child in THIS_PROCESS.children():
-        if "cov-report" in " ".join(child.cmdline()):
-            # If running coverage tests, ignore its background processes that
-            # come and go.
-            continue
         try:
             # The pid and creation time are for uniqueness. The cmdline is for
             # troubleshooting.
-            ret.add((child.pid, child.create_time(), " ".join(child.cmdline())))
+            key = (child.pid, child.create_time())
+            cmdline = _CHILD_CMDLINES.get(key)
+            if cmdline is None:
+                args = child.cmdline()
+                # If running coverage tests, ignore its background processes
+                # that come and go.
+                if any("cov-report" in arg for arg in args):
+                    continue
+                cmdline = _CHILD_CMDLINES[key] = " ".join(args)
         except psutil.NoSuchProcess:
-            pass
+            continue
+        ret.add((*key, cmdline))
     return ret
 
 
+def assert_no_new_children(initial_children, window_secs=0.2, poll_secs=0.01):
+    """
+    Repeatedly verifies that `get_children` still matches ``initial_children``
+    for ``window_secs``, so that a background task that spawns subprocesses
+    shortly after we return control to the test still gets caught.
+    """
+    deadline = time.monotonic() + window_secs
+    while True:
+        assert initial_children == get_children()
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(poll_secs)
+
+
+@pytest.fixture(scope="module")
+def ipp_client():
+    """
+    A client for a 1-engine cluster that's shared by the tests that only need
+    some working cluster, since starting one takes several seconds.
+    """
+    import ipyparallel as ipp
+
+    cluster = ipp.Cluster(n=1, log_level=logging.FATAL)
+    client = None
+    try:
+        client = cluster.start_and_connect_sync()
+        yield client
+    finally:
+        if client is not None:
+            client.close()
+        cluster.stop_engines_sync()
+        cluster.stop_controller_sync()
+
+
 def test_simple_args():
     # Future work: troubleshoot why initial_children has an extra
     # multiprocessing.spawn.spawn_main process that disappears by the time we
@@ -92,11 +146,8 @@ def test_cluster_provided():
     initial_children = get_children()
     cluster = ipp.Cluster(n=1, log_level=logging.FATAL)
     try:
-        # It should not auto-start anything yet. For this part, we give it a
-        # little time since it takes a while to create and connect to its
-        # subprocesses.
-        time.sleep(2)
-        assert initial_children == get_children()
+        # It should not auto-start anything yet.
+        assert_no_new_children(initial_children)
         # Now trigger things normally.
         with ExecutorCtx("ipyparallel", cluster=cluster) as exe:
             exe_children = get_children()
@@ -118,11 +169,8 @@ def test_client_provided_outside_ctx():
     initial_children = get_children()
     cluster = ipp.Cluster(n=1, log_level=logging.FATAL)
     try:
-        # It should not auto-start anything yet. For this part, we give it a
-        # little time since it takes a while to create and connect to its
-        # subprocesses.
-        time.sleep(2)
-        assert initial_children == get_children()
+        # It should not auto-start anything yet.
+        assert_no_new_children(initial_children)
         # Once we synchronously start everything, then everything should proceed
         # as usual.
         client = cluster.start_and_connect_sync()
@@ -130,7 +178,6 @@ def test_client_provided_outside_ctx():
         assert client_children > initial_children
         assert len(client_children) == len(initial_children) + 2
         with ExecutorCtx("ipyparallel", client=client) as exe:
-            assert client_children == get_children()
             assert exe.submit(os.getpid).result() != os.getpid()
             assert client_children == get_children()
         assert client_children == get_children()
@@ -150,7 +197,6 @@ def test_client_provided_within_ctx():
         assert client_children > initial_children
         assert len(client_children) == len(initial_children) + 2
         with ExecutorCtx("ipyparallel", client=client) as exe:
-            assert client_children == get_children()
             assert exe.submit(os.getpid).result() != os.getpid()
             assert client_children == get_children()
         assert client_children == get_children()
@@ -158,35 +204,35 @@ def test_client_provided_within_ctx():
 
 
 @pytest.mark.slow
-def test_always_picklable_func():
+def test_always_picklable_func(ipp_client):
     # If this crashes, everything will.
-    with ExecutorCtx("ipyparallel", 1) as exe:
+    with ExecutorCtx("ipyparallel", client=ipp_client) as exe:
         exe.submit(os.getpid).result()
 
 
 @pytest.mark.slow
-def test_import_env_transferred_without_cloudpickle():
+def test_import_env_transferred_without_cloudpickle(ipp_client):
     # This test module sits outside the normal import hierarchy, so this will
     # crash unless the remote workers have replicated the import environment of
     # the main process.
-    with ExecutorCtx("ipyparallel", 1) as exe:
+    with ExecutorCtx("ipyparallel", client=ipp_client) as exe:
         exe.submit(get_worker_id).result()
 
 
 @pytest.mark.slow
-def test_inner_func_pickling():
+def test_inner_func_pickling(ipp_client):
     # If this fails, it means that the pickler didn't figure out that the
     # function isn't at the global scope of its module.
     func = get_inner_func()
 
-    with ExecutorCtx("ipyparallel", 1) as exe:
+    with ExecutorCtx("ipyparallel", client=ipp_client) as exe:
         assert exe.submit(func).result() == 123
 
 
 @pytest.mark.slow
-def test_lambda_pickling():
+def test_lambda_pickling(ipp_client):
     # If this fails, it means the pickler can't handle lambdas properly.
-    with ExecutorCtx("ipyparallel", 1) as exe:
+    with ExecutorCtx("ipyparallel", client=ipp_client) as exe:
         assert exe.submit(lambda: 123).result() == 123
         func = get_inner_func()
         assert exe.submit(lambda: func()).result() == 123
@@ -194,10 +240,10 @@ def test_lambda_pickling():
 
 
 @pytest.mark.slow
-def test_double_picklability():
+def test_double_picklability(ipp_client):
     # Here we verify that advanced pickling is available in both directions. We
     # send a lambda and get back a lambda.
-    with ExecutorCtx("ipyparallel", 1) as exe:
+    with ExecutorCtx("ipyparallel", client=ipp_client) as exe:
         inner = lambda: 123  # NOQA
         outer = lambda: inner  # NOQA
         fut = exe.submit(outer)
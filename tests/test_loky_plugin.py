@@ -8,7 +8,10 @@ import os
 import platform
 import re
 import signal
+import sys
 import time
+from collections import Counter
+from concurrent.futures import wait
 from contextlib import contextmanager
 from functools import cache, partial
 from multiprocessing import Manager
@@ -21,18 +24,74 @@ from pyrseus.ctx.mgr import ExecutorCtx
 from pyrseus.ctx.registry import is_plugin_available
 
 # Magic global variable that skips the whole test module if the plugin isn't
-# installed.
+# installed. With ``pytest -n auto --dist=loadgroup``, the xdist_group keeps
+# this module's tests on one xdist worker, so that the module-scoped
+# ``loky_exe`` and ``manage_reusable_executor`` fixtures only set up loky's
+# executors once instead of once per worker.
 #
 # https://docs.pytest.org/en/latest/example/markers.html#scoped-marking
-pytestmark = pytest.mark.skipif(
-    not is_plugin_available("loky"), reason="loky is not available"
-)
+pytestmark = [
+    pytest.mark.skipif(not is_plugin_available("loky"), reason="loky is not available"),
+    pytest.mark.xdist_group(name="loky"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def manage_reusable_executor():
+    """
+    Warms up loky's process-wide reusable executor before this module's tests,
+    so that the first test doesn't pay for loky's cold start (imports, worker
+    startup, etc.). Afterwards, shuts it down so that its workers don't outlive
+    the module, e.g. on a pytest-xdist worker that goes on to run other modules.
+    """
+    from loky import get_reusable_executor
+
+    exe = get_reusable_executor(max_workers=1)
+    exe.submit(int).result()
+    yield
+    # Tests that use other settings (e.g. a longer timeout) replace the reusable
+    # executor, so also shut down whichever one is current. Don't look it up
+    # with get_reusable_executor(): if it had already been shut down, that
+    # would start a whole new pool just for us to kill it.
+    try:
+        from loky.reusable_executor import _executor_storage
+    except ImportError:  # a loky version with different internals
+        current_exe = None
+    else:
+        current_exe = _executor_storage.executor
+    for live_exe in {exe, current_exe} - {None}:
+        # This is a no-op for an executor that's already shut down.
+        live_exe.shutdown(wait=True, kill_workers=True)
+
+
+def get_start_time(pid):
+    """
+    Returns an opaque value that identifies when process ``pid`` started, or
+    None if there is no such process. Together with the pid, it uniquely
+    identifies a process.
+    """
+    if sys.platform == "linux":
+        # Fast path: one read, vs. psutil's object construction plus stat
+        # parsing. The starttime field is in clock ticks since boot.
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            return None
+        # The command name field can contain spaces and parentheses, so skip
+        # past its closing parenthesis before splitting. starttime is field 22,
+        # counting from 1, and the field after the command name is field 3.
+        return int(stat.rsplit(b")", 1)[1].split()[22 - 3])
+    try:
+        return psutil.Process(pid).create_time()
+    except psutil.NoSuchProcess:
+        return None
 
 
 @cache
 def get_worker_id():
-    proc = psutil.Process()
-    return (proc.pid, proc.create_time())
+    pid = os.getpid()
+    return (pid, get_start_time(pid))
 
 
 def get_inner_func():
@@ -43,47 +102,47 @@ def get_inner_func():
 
 
 def worker_exists(worker_id):
-    pid, create_time = worker_id
-    try:
-        proc = psutil.Process(pid)
-    except Exception:
-        return False
-    else:
-        return create_time == proc.create_time()
+    pid, start_time = worker_id
+    return get_start_time(pid) == start_time
+
+
+_ABBREV_STATES = {
+    "PENDING": "pending",
+    "RUNNING": "running",
+    # Future.cancelled() and Future.done() are both already true before the
+    # executor gets around to notifying the waiters of a cancelled future.
+    "CANCELLED": "cancelled",
+    "CANCELLED_AND_NOTIFIED": "cancelled",
+    "FINISHED": "success",
+}
+"""
+Lookup table for `get_abbrev_state`, keyed by the private state names used by
+`concurrent.futures.Future` (and thus by loky's futures).
+"""
 
 
 def get_abbrev_state(fut):
     """
     Summarizes the state of a Future.
+
+    This is a whitebox read of the future's state: one attribute read instead of
+    three lock-acquiring method calls. Like those calls, it's only a snapshot.
     """
-    run = fut.running()
-    cancelled = fut.cancelled()
-    done = fut.done()
-    return {
-        # We only enumerate the combinations we actually expect to see in these
-        # tests.
-        (False, False, False): "pending",
-        (True, False, False): "running",
-        (False, True, False): "cancel_pending",
-        (False, True, True): "cancelled",
-        (False, False, True): "success",
-    }[run, cancelled, done]
+    return _ABBREV_STATES[fut._state]
+
+
+_ZERO_STATE_COUNTS = dict.fromkeys(_ABBREV_STATES.values(), 0)
+"""
+Template for the non-sparse results of `count_states`.
+"""
 
 
 def count_states(futs, sparse=False):
-    counts = {
-        "pending": 0,
-        "running": 0,
-        "cancel_pending": 0,
-        "cancelled": 0,
-        "success": 0,
-    }
-    for fut in futs:
-        state = get_abbrev_state(fut)
-        counts[state] += 1
+    counts = Counter(get_abbrev_state(fut) for fut in futs)
     if sparse:
-        counts = {k: v for k, v in counts.items() if v != 0}
-    return counts
+        # Counting never creates zero entries.
+        return dict(counts)
+    return {**_ZERO_STATE_COUNTS, **counts}
 
 
 @pytest.mark.parametrize("reuse", (Ellipsis, False, True, "auto"))
@@ -113,100 +172,81 @@ def test_reusable_vs_reuse_types(reusable, reuse, expected):
         assert re.match(expected, fqn), (reusable, reuse, expected, fqn)
 
 
-def test_reusable_true():
+def test_reusable_lifecycle():
     """
-    Verifies that the reusable executors actually get reused.
+    Verifies that the reusable executors actually get reused, that
+    ``reuse=False`` actually causes a new reusable executor to be created, and
+    that the ``reuse`` and ``kill_workers`` parameters interact the way we
+    expect them to.
+
+    This is one linear scenario that shares a single reusable executor across
+    its steps, so that we only pay for a few worker startups.
     """
     with ExecutorCtx("loky", 1, reusable=True) as exe0:
         worker0 = exe0.submit(get_worker_id).result()
         assert get_worker_id() != worker0
+        assert worker_exists(worker0)
     assert worker_exists(worker0)
 
+    # The reusable executor actually gets reused.
     with ExecutorCtx("loky", 1, reusable=True) as exe1:
         assert exe1.submit(get_worker_id).result() == worker0
     assert worker_exists(worker0)
 
-    exe1.shutdown(kill_workers=True)  # be a good test and clean up
-    if platform.system() == "Windows":
-        time.sleep(0.2)  # Windows lacks true SIGTERM, so give it a moment.
-    assert not worker_exists(worker0)
-
-
-def test_reuse_false():
-    """
-    Verifies that ``reuse=False`` actually causes a new reusable executor to be
-    created.
-    """
-    with ExecutorCtx("loky", 1, reusable=True) as exe0:
-        worker0 = exe0.submit(get_worker_id).result()
-        assert get_worker_id() != worker0
-        assert worker_exists(worker0)
+    # kill_workers is ignored when reuse=True
+    with ExecutorCtx("loky", 1, reusable=True, reuse=True, kill_workers=True) as exe2:
+        assert exe2.submit(get_worker_id).result() == worker0
     assert worker_exists(worker0)
 
-    with ExecutorCtx("loky", 1, reusable=True, reuse=False) as exe1:
+    # reuse=False creates a new reusable executor, ...
+    with ExecutorCtx("loky", 1, reusable=True, reuse=False) as exe3:
         assert not worker_exists(worker0)
-        worker1 = exe1.submit(get_worker_id).result()
-        assert get_worker_id() != worker1
-        assert worker0 != worker1
+        worker3 = exe3.submit(get_worker_id).result()
+        assert get_worker_id() != worker3
+        assert worker0 != worker3
     assert not worker_exists(worker0)
-    assert worker_exists(worker1)
+    assert worker_exists(worker3)
 
-    with ExecutorCtx("loky", 1, reusable=True) as exe:
-        assert exe.submit(get_worker_id).result() == worker1
-    assert not worker_exists(worker0)
-    assert worker_exists(worker1)
+    # ... and it does bounce the workers when also using kill_workers=True.
+    with ExecutorCtx("loky", 1, reusable=True, reuse=False, kill_workers=True) as exe4:
+        worker4 = exe4.submit(get_worker_id).result()
+        assert get_worker_id() != worker4
+        assert worker3 != worker4
+    assert not worker_exists(worker3)
+    assert worker_exists(worker4)
 
-    exe1.shutdown(kill_workers=True)  # be a good test and clean up
+    with ExecutorCtx("loky", 1, reusable=True) as exe5:
+        assert exe5.submit(get_worker_id).result() == worker4
+    assert worker_exists(worker4)
+
+    exe5.shutdown(kill_workers=True)  # be a good test and clean up
+    if platform.system() == "Windows":
+        time.sleep(0.2)  # Windows lacks true SIGTERM, so give it a moment.
     assert not worker_exists(worker0)
-    assert not worker_exists(worker1)
+    assert not worker_exists(worker3)
+    assert not worker_exists(worker4)
 
 
-def test_reuse_and_kill_workers():
+@pytest.fixture(scope="module")
+def loky_exe():
     """
-    Verifies that the ``reuse`` and ``kill_workers`` parameters interact the way
-    we expect them to.
+    A non-reusable executor shared by the pickling tests, none of which care
+    which worker runs their tasks.
     """
-    with ExecutorCtx("loky", 1, reusable=True) as exe0:
-        worker0 = exe0.submit(get_worker_id).result()
-        assert get_worker_id() != worker0
-    assert worker_exists(worker0)
-
-    # kill_workers is ignored when reuse=True
-    with ExecutorCtx("loky", 1, reusable=True, reuse=True, kill_workers=True) as exe1:
-        assert exe1.submit(get_worker_id).result() == worker0
-    assert worker_exists(worker0)
-
-    # but it does bounce the workers when reuse=False
-    with ExecutorCtx("loky", 1, reusable=True, reuse=False, kill_workers=True) as exe2:
-        worker2 = exe2.submit(get_worker_id).result()
-        assert get_worker_id() != worker2
-        assert worker0 != worker2
-    assert not worker_exists(worker0)
-    assert worker_exists(worker2)
-
-    with ExecutorCtx("loky", 1, reusable=True) as exe3:
-        assert exe3.submit(get_worker_id).result() == worker2
-    assert not worker_exists(worker0)
-    assert worker_exists(worker2)
-
-    exe3.shutdown(kill_workers=True)  # be a good test and clean up
-    if platform.system() == "Windows":
-        time.sleep(0.2)  # Windows lacks true SIGTERM, so give it a moment.
-    assert not worker_exists(worker0)
-    assert not worker_exists(worker2)
+    with ExecutorCtx("loky", 1) as exe:
+        yield exe
 
 
-def test_always_picklable_func():
+def test_always_picklable_func(loky_exe):
     """
     Test that verifies that if our other picklability tests fail, it's due to a
     general problem, not a pickling-specific problem.
     """
     # If this crashes, everything will.
-    with ExecutorCtx("loky", 1) as exe:
-        exe.submit(os.getpid).result()
+    loky_exe.submit(os.getpid).result()
 
 
-def test_import_env_transferred():
+def test_import_env_transferred(loky_exe):
     """
     Verifies that our `sys.path` gets propagated to the workers with the
     ``"loky"`` plugin. If this fails, then the rest of the pickling tests may
@@ -216,23 +256,21 @@ def test_import_env_transferred():
     # This test module sits outside the normal import hierarchy, so this will
     # crash unless the remote workers have replicated the import environment of
     # the main process.
-    with ExecutorCtx("loky", 1) as exe:
-        exe.submit(get_worker_id).result()
+    loky_exe.submit(get_worker_id).result()
 
 
-def test_inner_func_pickling():
+def test_inner_func_pickling(loky_exe):
     """
     Verifies that non-global functions get pickled correctly. These have the
     same type as global functions but are not directly importable.
     """
     # If this fails, it means that the pickler didn't figure out that the
     # function isn't at the global scope of its module.
-    with ExecutorCtx("loky", 1) as exe:
-        func = get_inner_func()
-        assert exe.submit(func).result() == 123
+    func = get_inner_func()
+    assert loky_exe.submit(func).result() == 123
 
 
-def test_lambda_pickling():
+def test_lambda_pickling(loky_exe):
     """
     Verifies that lambda functions get pickled correctly. These have a different
     type than global or inner functions, so it's generally easier to get these
@@ -240,28 +278,26 @@ def test_lambda_pickling():
     if `sys.path` has not been propagated to the workers.
     """
     # If this fails, it means the pickler can't handle lambdas properly.
-    with ExecutorCtx("loky", 1) as exe:
-        assert exe.submit(lambda: 123).result() == 123
-        assert exe.submit(lambda: get_inner_func()()).result() == 123
-        func = get_inner_func()
-        assert exe.submit(lambda: func()).result() == 123
-        assert exe.submit(lambda func=func: func()).result() == 123
+    assert loky_exe.submit(lambda: 123).result() == 123
+    assert loky_exe.submit(lambda: get_inner_func()()).result() == 123
+    func = get_inner_func()
+    assert loky_exe.submit(lambda: func()).result() == 123
+    assert loky_exe.submit(lambda func=func: func()).result() == 123
 
 
-def test_double_picklability():
+def test_double_picklability(loky_exe):
     """
     Verifies that a smart pickler like |cloudpickle|_ is being used not just for
     sending tasks, but also for getting their results.
     """
     # Here we verify that advanced pickling is available in both directions. We
     # send a lambda and get back a lambda.
-    with ExecutorCtx("loky", 1) as exe:
-        inner = lambda: 123  # NOQA
-        outer = lambda: inner  # NOQA
-        fut = exe.submit(outer)
-        inner_ret = fut.result()
-        ret = inner_ret()
-        assert ret == 123
+    inner = lambda: 123  # NOQA
+    outer = lambda: inner  # NOQA
+    fut = loky_exe.submit(outer)
+    inner_ret = fut.result()
+    ret = inner_ret()
+    assert ret == 123
 
 
 @contextmanager
@@ -269,6 +305,9 @@ def setup_reusable_test(max_workers):
     """
     Helper for tests that mix a reusable executor, a managed proxy of that same
     executor, and the ability to create shared barriers for testing.
+
+    The barriers are Manager proxies because loky pickles the tasks that use
+    them, which plain multiprocessing barriers don't allow.
     """
     from loky import get_reusable_executor
 
@@ -296,8 +335,18 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
     if platform.system() == "Darwin":
         pytest.skip("This test times out on macOS.")
 
+    NUM_TASKS = 10
     barrier_sets = []
 
+    def wait_until(predicate, timeout_secs=5):
+        """
+        Polls ``predicate`` until it returns True.
+        """
+        deadline = time.monotonic() + timeout_secs
+        while not predicate():
+            assert time.monotonic() < deadline, "Timed out"
+            time.sleep(0.001)
+
     def get_next_waiter(*barriers):
         """
         Appends the supplied `barriers` as a tuple to `barrier_sets` and returns
@@ -331,6 +380,13 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
         # allowed to finish.
         futs = [direct.submit(get_next_waiter(Barrier(3), Barrier(2)))]
 
+        # With the queue_size=1 hack, Loky only moves a pending task into its
+        # call queue when its queue management thread wakes up, e.g. because of
+        # a submit call. So before submitting the next task, wait for a worker
+        # to take this one out of the call queue. Otherwise the next one may
+        # never get scheduled.
+        wait_until(lambda: barrier_sets[0][0].n_waiting == 1)
+
         # Now create a context manager that reuses the same executor.
         with get_ctx() as ctx:
             try:
@@ -341,15 +397,6 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
                 # Append one task that'll jointly wait with the direct task.
                 futs.append(ctx.submit(get_next_waiter(barrier_sets[0][0], Barrier(2))))
 
-                # Append a few more that should all be stuck behind the first
-                # two. Make enough of them that we can successfully cancel some
-                # later, despite Loky's aggressive latency-optimized queueing
-                # system.
-                for i in range(2, 100):
-                    futs.append(ctx.submit(get_next_waiter(Barrier(2))))
-                assert len(barrier_sets) == 100
-                assert len(futs) == 100
-
                 # Wait for the first two to be running. Note that we can't trust
                 # the abbrev_state too much: Loky puts extra tasks in the
                 # running state to reduce latency, even though they're not
@@ -357,6 +404,17 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
                 assert barrier_sets[0][0] is barrier_sets[1][0]
                 barrier_sets[0][0].wait(5)
                 time.sleep(0.01)  # give both workers a moment to hit the next barrier
+
+                # Append a few more that should all be stuck behind the first
+                # two. With both workers busy and the queue_size=1 hack above,
+                # only the first of these gets pre-queued, making it
+                # uncancellable. So 10 tasks in total leaves plenty to cancel.
+                for i in range(2, NUM_TASKS):
+                    futs.append(ctx.submit(get_next_waiter(Barrier(2))))
+                assert len(barrier_sets) == NUM_TASKS
+                assert len(futs) == NUM_TASKS
+                wait_until(futs[2].running)
+
                 assert get_abbrev_state(futs[0]) == "running"
                 assert get_abbrev_state(futs[1]) == "running"
                 assert barrier_sets[0][0].n_waiting == 0  # passed shared barrier
@@ -369,9 +427,9 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
                 # their barriers. We want to verify that they get cancelled
                 # before being scheduled.
                 num_cancelled = 0
-                for i in range(2, 100):
+                for i in range(2, NUM_TASKS):
                     num_cancelled += futs[i].cancel()
-                assert num_cancelled == 100 - 3  # 2 in progress, 1 pre-queued
+                assert num_cancelled == NUM_TASKS - 3  # 2 in progress, 1 pre-queued
 
                 # Let fut 1 (only) return. We have to give a small timeout here
                 # because we're doing sequential waits in the workers, not set
@@ -400,17 +458,15 @@ def test_reusable_can_exit_ctx_while_direct_fut_blocks():
         assert get_abbrev_state(futs[1]) == "success"
         assert get_abbrev_state(futs[2]) == "success"
         counts = count_states(futs, sparse=True)
-        assert counts == {"running": 1, "success": 2, "cancelled": 97}
+        assert counts == {"running": 1, "success": 2, "cancelled": NUM_TASKS - 3}
 
         # Let the direct task finish.
         barrier_sets[0][1].wait(1)
-        for _ in range(10):
-            if get_abbrev_state(futs[0]) == "success":
-                break
-            time.sleep(0.1)
+        done, _ = wait([futs[0]], timeout=1)
+        assert futs[0] in done
         assert get_abbrev_state(futs[0]) == "success"
         counts = count_states(futs, sparse=True)
-        assert counts == {"success": 3, "cancelled": 97}
+        assert counts == {"success": 3, "cancelled": NUM_TASKS - 3}
 
         direct.shutdown(wait=True, kill_workers=True)
 
@@ -440,33 +496,40 @@ def test_reusable_futs_wait_on_exit():
                 barrier_state = "released"
 
         with SignalHandlerCtx(signal.SIGALRM, release_barrier_on_sigalrm):
-            with get_ctx() as exe:
-                # Warm up the system.
-                assert None is exe.submit(lambda: None).result()
-
-                # Estimate the round trip time.
-                t0 = time.time()
-                assert None is exe.submit(lambda: None).result()
-                t1 = time.time()
-                rtt_secs = t1 - t0
-
-                # Submit a task that'll block till we release it. But don't wait
-                # on
-                fut = exe.submit(barrier.wait)
-
-                # Setup the alarm for a little while in the future. Make it long
-                # enough that it's unlikely that the task would take that long
-                # if we used a 1-party instead of 2-party barrier.
-                wait_secs = max(1, int(rtt_secs * 4))
-                earliest_exit_time = time.time() + wait_secs
-                assert barrier_state == "created"
-                signal.alarm(wait_secs)
-
-            # Verify that __exit__ blocked till our task was done running.
-            actual_exit_time = time.time()
-            assert actual_exit_time >= earliest_exit_time
-            assert barrier_state == "released"
-            assert get_abbrev_state(fut) == "success"
+            try:
+                with get_ctx() as exe:
+                    # Warm up the system.
+                    assert None is exe.submit(lambda: None).result()
+
+                    # Estimate the round trip time.
+                    t0 = time.time()
+                    assert None is exe.submit(lambda: None).result()
+                    t1 = time.time()
+                    rtt_secs = t1 - t0
+
+                    # Submit a task that'll block till we release it. But don't
+                    # wait on
+                    fut = exe.submit(barrier.wait)
+
+                    # Setup the alarm for a little while in the future. Make it
+                    # long enough that it's unlikely that the task would take
+                    # that long if we used a 1-party instead of 2-party barrier.
+                    # Unlike signal.alarm, setitimer supports fractional
+                    # seconds, so we don't have to wait for at least 1s.
+                    wait_secs = max(0.1, rtt_secs * 4)
+                    earliest_exit_time = time.time() + wait_secs
+                    assert barrier_state == "created"
+                    signal.setitimer(signal.ITIMER_REAL, wait_secs)
+
+                # Verify that __exit__ blocked till our task was done running.
+                actual_exit_time = time.time()
+                assert actual_exit_time >= earliest_exit_time
+                assert barrier_state == "released"
+                assert get_abbrev_state(fut) == "success"
+            finally:
+                # Cancel any pending timer so that it can't fire after we've
+                # restored the original SIGALRM handler.
+                signal.setitimer(signal.ITIMER_REAL, 0)
 
 
 def test_reusable_fut_leaks():
@@ -478,13 +541,12 @@ def test_reusable_fut_leaks():
     we're testing an internal optimization.
     """
     with setup_reusable_test(1) as (get_reusable, get_ctx, Barrier):
+        # Create the barriers up front, so that creating them doesn't delay
+        # the submissions.
+        barriers = [Barrier(2) for _ in range(10)]
         with get_ctx() as exe:
             # Submit a bunch of tasks that each block tell we let them proceed.
-            barriers = []
-            futs = []
-            for _ in range(10):
-                barriers.append(Barrier(2))
-                futs.append(exe.submit(barriers[-1].wait))
+            futs = [exe.submit(barrier.wait) for barrier in barriers]
             # All of them are in the cleanup set.
             assert exe._futs == set(futs)
             # Release the futures one at a time and verify that they get removed
@@ -13,12 +13,17 @@ from pyrseus.ctx.mgr import ExecutorCtx
 from pyrseus.ctx.registry import is_plugin_available
 
 # Magic global variable that skips the whole test module if the plugin isn't
-# installed.
+# installed. With ``pytest -n auto --dist=loadgroup``, the xdist_group keeps
+# this module's tests on one xdist worker, so that the module-scoped ``mpi_exe``
+# fixture only spawns its MPI worker once instead of once per worker.
 #
 # https://docs.pytest.org/en/latest/example/markers.html#scoped-marking
-pytestmark = pytest.mark.skipif(
-    not is_plugin_available("mpi4py"), reason="mpi4py is not available"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not is_plugin_available("mpi4py"), reason="mpi4py is not available"
+    ),
+    pytest.mark.xdist_group(name="mpi4py"),
+]
 
 
 @cache
@@ -34,50 +39,67 @@ def get_inner_func():
     return inner_func
 
 
-def test_always_picklable_func():
-    # If this crashes, everything will.
+@pytest.fixture(scope="module")
+def mpi_exe():
+    """
+    An executor shared by the pickling tests, so that they only have to pay for
+    spawning an MPI worker once. The tests that expect pickling failures only
+    wrap their submit and result calls in `pytest.raises`, so a failure to
+    create the executor still gets reported as an error.
+    """
     with ExecutorCtx("mpi4py", 1) as exe:
-        exe.submit(os.getpid).result()
+        yield exe
+
+
+def assert_still_usable(exe):
+    """
+    Verifies that ``exe`` still runs tasks, so that a test expecting a pickling
+    failure can't pass just because an earlier test broke the shared executor.
+    """
+    assert exe.submit(abs, -1).result() == 1
+
+
+def test_always_picklable_func(mpi_exe):
+    # If this crashes, everything will.
+    mpi_exe.submit(os.getpid).result()
 
 
 @pytest.mark.slow
-def test_import_env_transferred():
+def test_import_env_transferred(mpi_exe):
     # This test module sits outside the normal import hierarchy, so this will
     # crash unless the remote workers have replicated the import environment of
     # the main process.
     try:
-        with ExecutorCtx("mpi4py", 1) as exe:
-            exe.submit(get_worker_id).result()
+        mpi_exe.submit(get_worker_id).result()
     except Exception as ex:
         raise AssertionError("failed") from ex
 
 
 @pytest.mark.slow
-def test_inner_func_pickling():
+def test_inner_func_pickling(mpi_exe):
     # If this fails, it means that the pickler didn't figure out that the
     # function isn't at the global scope of its module.
     func = get_inner_func()
 
     with pytest.raises(Exception):
-        with ExecutorCtx("mpi4py", 1) as exe:
-            exe.submit(func).result()
+        mpi_exe.submit(func).result()
+    assert_still_usable(mpi_exe)
 
 
 @pytest.mark.slow
-def test_lambda_pickling():
+def test_lambda_pickling(mpi_exe):
     # If this fails, it means the pickler can't handle lambdas properly.
     with pytest.raises(Exception):
-        with ExecutorCtx("mpi4py", 1) as exe:
-            exe.submit(lambda: 123).result()
+        mpi_exe.submit(lambda: 123).result()
+    assert_still_usable(mpi_exe)
 
 
 @pytest.mark.slow
-def test_double_picklability():
+def test_double_picklability(mpi_exe):
     # Here we verify that advanced pickling is available in both directions. We
     # send a lambda and get back a lambda.
+    inner = lambda: 123  # NOQA
+    outer = lambda: inner  # NOQA
     with pytest.raises(Exception):
-        with ExecutorCtx("mpi4py", 1) as exe:
-            inner = lambda: 123  # NOQA
-            outer = lambda: inner  # NOQA
-            fut = exe.submit(outer)
-            fut.result()
+        mpi_exe.submit(outer).result()
+    assert_still_usable(mpi_exe)
@@ -37,9 +37,10 @@ That file is subject to the following license::
 
 import os.path
 import platform
+import re
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Union
 
 import pytest
@@ -50,6 +51,10 @@ from pyrseus.ctx.registry import skip_if_unavailable
 # library, so they're slow to run. We skip them all in CI runs.
 #
 # These tests rely on SIGALRM. Unfortunately, that doesn't exist on Windows.
+#
+# Each case runs in its own subprocess, so unlike the plugin test modules, this
+# one has no xdist_group: ``pytest -n auto --dist=loadgroup`` can spread the
+# cases across all of its workers.
 if platform.system() == "Windows":
     pytestmark = [
         pytest.mark.skip("SIGALRM does not exist on Windows"),
@@ -59,7 +64,7 @@ else:
     pytestmark = pytest.mark.slow
 
 
-@dataclass
+@dataclass(frozen=True)
 class Case:
     func_name: str
     arg_name: str
@@ -67,17 +72,23 @@ class Case:
     errors: Optional[Union[str, Tuple[str]]] = None
     loky_errors: Optional[Union[str, Tuple[str]]] = None
     timeout_secs: int = 2
+    # Derived from errors by __post_init__.
+    eff_errors: Tuple[str, ...] = field(init=False, repr=False)
+    unexpected_errors: Tuple[str, ...] = field(init=False, repr=False)
 
-    @property
-    def eff_errors(self):
+    def __post_init__(self):
         if self.errors is None:
-            return ()
+            eff_errors = ()
         elif isinstance(self.errors, str):
-            return (self.errors,)
+            eff_errors = (self.errors,)
         elif isinstance(self.errors, tuple):
-            return self.errors
+            eff_errors = self.errors
         else:
-            return TypeError(type(self.errors))
+            raise TypeError(type(self.errors))
+        unexpected_errors = tuple(sorted(set(KNOWN_ERROR_STRINGS) - set(eff_errors)))
+        # Frozen dataclasses need this to set attributes.
+        object.__setattr__(self, "eff_errors", eff_errors)
+        object.__setattr__(self, "unexpected_errors", unexpected_errors)
 
 
 KNOWN_ERROR_STRINGS = (
@@ -147,16 +158,66 @@ CASES: List[Union[Case, Dict[Optional[str], Case]]] = [
 ]
 
 
-@pytest.mark.parametrize("case", list(range(len(CASES))))
-@pytest.mark.parametrize("plugin", ("process", "loky"))
-def test_crash_scenarios(plugin: str, case: int):
-    skip_if_unavailable(plugin)
+PLUGINS = ("process", "loky")
+
+
+def _iter_all_cases():
+    for case in CASES:
+        if isinstance(case, dict):
+            yield from case.values()
+        else:
+            yield case
+
+
+_SCAN_RE = re.compile(
+    b"|".join(
+        [rb"^STEP: (\S+)"]
+        + [
+            re.escape(s.encode())
+            for s in sorted(
+                set(KNOWN_ERROR_STRINGS).union(
+                    *(case.eff_errors for case in _iter_all_cases())
+                )
+            )
+        ]
+    ),
+    re.MULTILINE,
+)
+"""
+Finds both the steps and every error string that any case checks for, so that
+each test only has to scan its script's output once. It works on the raw bytes,
+since a crashing worker may write partial or non-UTF-8 output.
+"""
 
-    case = CASES[case]
-    if isinstance(case, dict):
-        case = case.get(plugin, case[None])
 
-    # Run the simple executor test.
+def expand_cases(plugins, cases):
+    """
+    Pairs each plugin with each of the given ``cases``, resolving any
+    plugin-specific variants. The test ids are ``"plugin-func_name-arg_name"``,
+    so that ``-k`` can select cases by name.
+    """
+    params = []
+    for plugin in plugins:
+        for case in cases:
+            if isinstance(case, dict):
+                case = case.get(plugin, case[None])
+            params.append(
+                pytest.param(
+                    plugin, case, id=f"{plugin}-{case.func_name}-{case.arg_name}"
+                )
+            )
+    return params
+
+
+@pytest.mark.parametrize("plugin,case", expand_cases(PLUGINS, CASES))
+def test_crash_scenarios(plugin: str, case: Case):
+    skip_if_unavailable(plugin)
+
+    # Run the simple executor test. Each case deliberately gets a fresh
+    # interpreter instead of a reused (or forked) helper process: most cases
+    # kill or wedge the process, and what we're testing includes how the whole
+    # interpreter shuts down (thread joins, atexit handlers, orphaned workers
+    # still holding our stdout pipe, etc.).
     cmd = [
         sys.executable,
         "_crash_script.py",
@@ -171,39 +232,39 @@ def test_crash_scenarios(plugin: str, case: int):
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         timeout=case.timeout_secs + 5,  # an extra layer of timeout protection
-        text=True,
     )
 
+    last_step = None
+    found_errors = set()
+    for m in _SCAN_RE.finditer(res.stdout):
+        if m.group(1) is not None:
+            last_step = m.group(1).decode(errors="replace")
+        else:
+            found_errors.add(m.group(0).decode())
+
     # Quick checks and early exit if we expected it to succeed.
     if case.last_step == "EXITING-SCRIPT":
         assert res.returncode == 0
-        assert res.stdout.rstrip().endswith("STEP: EXITING-SCRIPT")
-        for s in KNOWN_ERROR_STRINGS:
-            assert s not in res.stdout, s
+        assert res.stdout.rstrip().endswith(b"STEP: EXITING-SCRIPT")
+        assert not found_errors.intersection(KNOWN_ERROR_STRINGS), found_errors
         return
 
     # More involved checks for the normal case of expecting some kind of
     # failure.
     msgs = []
 
-    last_step = None
-    lines = res.stdout.splitlines()
-    for line in lines:
-        if line.startswith("STEP: "):
-            last_step = line.split()[1]
     if last_step != case.last_step:
         msgs.append(f"Last step: expected={case.last_step} actual={last_step}")
 
-    errors = case.eff_errors
-    for error in errors:
-        if error not in res.stdout:
+    for error in case.eff_errors:
+        if error not in found_errors:
             msgs.append(
                 f"Expected {error} in the test script's output, "
                 f"but it was not there."
             )
 
-    for error in sorted(set(KNOWN_ERROR_STRINGS) - set(errors)):
-        if error in res.stdout:
+    for error in case.unexpected_errors:
+        if error in found_errors:
             msgs.append(f"Unexpected error {error} in the test script's output.")
 
     if msgs:
@@ -211,5 +272,5 @@ def test_crash_scenarios(plugin: str, case: int):
         msgs.append("Command:")
         msgs.append(" ".join(cmd))
         msgs.append("Script output:")
-        msgs.append(res.stdout)
+        msgs.append(res.stdout.decode(errors="replace"))
         pytest.fail("\n".join(msgs))
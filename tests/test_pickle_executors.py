@@ -0,0 +1,62 @@
+"""
+Verifies that the `pickle`-based serial executors really pickle their tasks and
+results.
+"""
+
+import pytest
+from pyrseus.executors.pinline import PInlineExecutor
+from pyrseus.executors.pnocatch import PNoCatchExecutor
+
+
+def picklable():
+    return 1
+
+
+def make_lambda():
+    return lambda: 2
+
+
+def make_double_unpicklable():
+    return lambda: lambda: 3
+
+
+@pytest.fixture(params=(PInlineExecutor, PNoCatchExecutor), ids=lambda c: c.__name__)
+def exe_cls(request):
+    return request.param
+
+
+def assert_cant_pickle(exe, func):
+    """
+    Verifies that submitting ``func`` fails due to a pickling error. The
+    "nocatch" executor raises it directly from ``submit``, while the other one
+    captures it in the returned future.
+    """
+    if isinstance(exe, PNoCatchExecutor):
+        with pytest.raises(Exception, match="Can't pickle"):
+            exe.submit(func)
+    else:
+        fut = exe.submit(func)
+        with pytest.raises(Exception, match="Can't pickle"):
+            fut.result()
+
+
+def test_picklable(exe_cls):
+    with exe_cls() as exe:
+        fut = exe.submit(picklable)
+        ret = fut.result()
+        assert ret == 1
+
+
+def test_lambda(exe_cls):
+    with exe_cls() as exe:
+        assert_cant_pickle(exe, make_lambda())
+
+
+def test_return_lambda(exe_cls):
+    with exe_cls() as exe:
+        assert_cant_pickle(exe, make_lambda)
+
+
+def test_double_unpicklable(exe_cls):
+    with exe_cls() as exe:
+        assert_cant_pickle(exe, make_double_unpicklable())
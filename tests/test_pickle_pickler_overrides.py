@@ -28,6 +28,14 @@ def logged_loads(obj):
     return ret
 
 
+def get_protocol(pickled):
+    """
+    Returns the protocol number from the PROTO opcode at the start of a pickle.
+    """
+    assert pickled[:1] == pickle.PROTO
+    return pickled[1]
+
+
 class LogResettingMixin:
     def setUp(self):
         LOG[:] = []
@@ -88,6 +96,15 @@ class TestOncePickledObject(LogResettingMixin, TestCase):
         assert isinstance(reconstructed, int)  # not OncePickledObject
         assert reconstructed == 42
 
+    def test_inner_protocol(self):
+        # The inner pickle uses the highest protocol, even when the outer one
+        # uses an old protocol.
+        opo = OncePickledObject(42, logged_dumps, logged_loads)
+        pickled = pickle.dumps(opo, 2)
+        assert get_protocol(pickled) == 2
+        _, (inner,) = opo.__reduce_ex__(2)
+        assert get_protocol(inner) == pickle.HIGHEST_PROTOCOL
+
 
 class TestCustomPickledClosure(LogResettingMixin, TestCase):
     """
@@ -124,3 +141,10 @@ class TestCustomPickledClosure(LogResettingMixin, TestCase):
         unwrapped_ret = pickle.loads(pickled_ret)
         assert LOG == ["pickled", "unpickled", "pickled", "unpickled"]
         assert unwrapped_ret == 12
+
+    def test_inner_protocol(self):
+        # Like for OncePickledObject, the inner pickle uses the highest
+        # protocol, even when the outer one uses an old protocol.
+        closure = CustomPickledClosure(add_10, (2,), {}, logged_dumps, logged_loads)
+        _, (_, dumped_args) = closure.__reduce_ex__(2)
+        assert get_protocol(dumped_args) == pickle.HIGHEST_PROTOCOL
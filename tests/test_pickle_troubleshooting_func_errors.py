@@ -27,13 +27,31 @@ def get_lambda():
     return lambda: 42
 
 
+# The definitions that MainFuncCtx and MainClsCtx inject into __main__. They're
+# compiled once here, so each context only needs to run the code objects.
+_MAIN_FUNC_NAME = "pyrseus_test_pickle_main_func"
+_MAIN_FUNC_CODE = compile(f"def {_MAIN_FUNC_NAME}(): return 42", "<main_func>", "exec")
+_MAIN_CLS_NAME = "PyrseusTestPickleMainCls"
+_MAIN_CLS_CODE = compile(
+    dedent(
+        f"""
+        class {_MAIN_CLS_NAME}:
+            def mthd(self):
+                return 42
+        """
+    ).strip(),
+    "<main_cls>",
+    "exec",
+)
+
+
 @contextmanager
 def MainFuncCtx():
     main_mod = sys.modules["__main__"]
     main_globals = main_mod.__dict__
-    name = "pyrseus_test_pickle_main_func"
+    name = _MAIN_FUNC_NAME
     assert name not in main_globals  # check for improper cleanup of other tests
-    exec(f"def {name}(): return 42", main_globals)
+    exec(_MAIN_FUNC_CODE, main_globals)
     yield main_globals[name]
     del main_globals[name]  # clean up after ourselves
 
@@ -42,16 +60,9 @@ def MainFuncCtx():
 def MainClsCtx():
     main_mod = sys.modules["__main__"]
     main_globals = main_mod.__dict__
-    name = "PyrseusTestPickleMainCls"
+    name = _MAIN_CLS_NAME
     assert name not in main_globals  # check for improper cleanup of other tests
-    src = dedent(
-        f"""
-        class {name}:
-            def mthd(self):
-                return 42
-        """
-    ).strip()
-    exec(src, main_globals)
+    exec(_MAIN_CLS_CODE, main_globals)
     yield main_globals[name]
     del main_globals[name]  # clean up after ourselves
 
@@ -3,6 +3,7 @@ Verifies that `.ExecutorCtx` creates exactly the right number of workers with
 the ``"thread"`` and ``"process"`` plugins.
 """
 
+import multiprocessing
 import os
 import threading
 from contextlib import ExitStack
@@ -14,9 +15,68 @@ from pyrseus.core.sys import get_num_available_cores
 from pyrseus.ctx.mgr import ExecutorCtx
 from pyrseus.ctx.registry import skip_if_unavailable
 
+# With ``pytest -n auto --dist=loadgroup``, the xdist_group runs this module's
+# cases one at a time on a single xdist worker, so that no two of its
+# max_workers=None cases (each starting a worker per core) overlap. Other
+# modules' tests still run in parallel on the other xdist workers.
+pytestmark = pytest.mark.xdist_group(name="pool_sizes")
+
 PROC_TIMEOUT_SECS = 1  # should be long enough
 THREAD_TIMEOUT_SECS = 0.1  # should be long enough
 
+INHERITED_BARRIER_PLUGINS = frozenset(("cpprocess", "process"))
+"""
+Plugins whose workers can inherit `multiprocessing.Barrier` objects via an
+``initializer``, so that we don't need a `multiprocessing.Manager` server (and
+its per-wait round trips) to share barriers with them.
+"""
+
+LOCAL_BARRIER_PLUGINS = frozenset(("inline", "nocatch", "thread"))
+"""
+Plugins that run tasks in this process without pickling them, so that they can
+use plain `threading.Barrier` objects.
+"""
+
+_INHERITED_BARRIERS = None
+"""
+A worker's copy of the test's barriers, in the order the test created them, so
+that an `InheritedBarrier` can look its barrier up by index.
+"""
+
+
+def init_inherited_barriers(barriers):
+    """
+    Worker initializer that stores the list of ``barriers`` passed through the
+    executor's ``initargs``. Tasks then refer to them by their index in that
+    list, via `InheritedBarrier`, since a `multiprocessing.Barrier` can't be
+    pickled along with a task.
+    """
+    global _INHERITED_BARRIERS
+    _INHERITED_BARRIERS = barriers
+
+
+class InheritedBarrier:
+    """
+    Picklable stand-in for one of the barriers a worker got from
+    `init_inherited_barriers`.
+    """
+
+    def __init__(self, index):
+        self.index = index
+
+    def wait(self):
+        return _INHERITED_BARRIERS[self.index].wait()
+
+
+@pytest.fixture(scope="module")
+def sync_mgr():
+    """
+    One Manager server shared by all of the tests that need one, instead of
+    starting a new server process for each test.
+    """
+    with Manager() as mgr:
+        yield mgr
+
 
 def coordinated_get_pid_and_tid(parent_pid, parent_tid, barrier, concurrency_style):
     """
@@ -65,7 +125,7 @@ def coordinated_get_pid_and_tid(parent_pid, parent_tid, barrier, concurrency_sty
         ("thread", "thread"),
     ),
 )
-def test_plugin_pool_size(plugin, concurrency_style, max_workers):
+def test_plugin_pool_size(request, plugin, concurrency_style, max_workers):
     skip_if_unavailable(plugin)
 
     if max_workers is None:
@@ -112,12 +172,34 @@ def test_plugin_pool_size(plugin, concurrency_style, max_workers):
 
     parent_pid = os.getpid()
     parent_tid = threading.get_ident()
+    barrier_sizes = (num_tasks, num_tasks + 1)
     with ExitStack() as es:
-        # Setup the manager that will create the Barrier object for us.
-        sync_mgr = es.enter_context(Manager())
-
-        # Empty for now, but useful to keep for troubleshooting.
-        ctx_kwargs = {}
+        if plugin in LOCAL_BARRIER_PLUGINS:
+            barriers = [
+                threading.Barrier(n, timeout=timeout_secs) for n in barrier_sizes
+            ]
+            ctx_kwargs = {}
+        elif plugin in INHERITED_BARRIER_PLUGINS:
+            # Create the barriers up front so that the workers can inherit them.
+            barriers = [InheritedBarrier(i) for i in range(len(barrier_sizes))]
+            ctx_kwargs = {
+                "initializer": init_inherited_barriers,
+                "initargs": (
+                    [
+                        multiprocessing.Barrier(n, timeout=timeout_secs)
+                        for n in barrier_sizes
+                    ],
+                ),
+            }
+        else:
+            # Use the manager that will create the Barrier objects for us. It's
+            # only started if some test needs it.
+            sync_mgr = request.getfixturevalue("sync_mgr")
+            barriers = [
+                sync_mgr.Barrier(n, timeout=timeout_secs) for n in barrier_sizes
+            ]
+            # Empty for now, but useful to keep for troubleshooting.
+            ctx_kwargs = {}
 
         # Create the ExecutorCtx. It will auto-adjust max_workers if it's zero
         # and the plugin is concurrent-only, or if it's non-zero and the plugin
@@ -127,7 +209,7 @@ def test_plugin_pool_size(plugin, concurrency_style, max_workers):
 
         # First check that at least the expected number of workers are started.
         futs = []
-        barrier = sync_mgr.Barrier(num_tasks, timeout=timeout_secs)
+        barrier = barriers[0]
         for _ in range(num_tasks):
             futs.append(
                 exe.submit(
@@ -147,7 +229,7 @@ def test_plugin_pool_size(plugin, concurrency_style, max_workers):
         # setting up the barrier, and (b) we expect every task to fail instead
         # of none of them.
         futs = []
-        barrier = sync_mgr.Barrier(num_tasks + 1, timeout=timeout_secs)
+        barrier = barriers[1]
         for _ in range(num_tasks + 1):
             with ExitStack() as es2:
                 if plugin.endswith("nocatch"):
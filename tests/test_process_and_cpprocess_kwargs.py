@@ -7,7 +7,7 @@ due to the test parametrization we use.
 import inspect
 import multiprocessing
 import os
-from collections import defaultdict
+from collections import Counter
 from concurrent.futures import ProcessPoolExecutor
 from contextlib import ExitStack
 from pickle import PickleError
@@ -30,6 +30,10 @@ def get_worker_id():
     return os.getpid()
 
 
+def get_worker_id_of_task(_):
+    return os.getpid()
+
+
 def get_global_pid():
     return PID
 
@@ -43,29 +47,72 @@ def get_lambda():
     return lambda: 123
 
 
-def _get_mp_context_or_skip(start_method):
+def _start_method_param(start_method):
+    """
+    Wraps ``start_method`` for the `mp_context` fixture. Unsupported start
+    methods are skipped at collection time, and with ``pytest -n auto
+    --dist=loadgroup``, all of a start method's tests run on one worker, so that
+    they share that worker's module-scoped fixtures (and its forkserver process)
+    instead of recreating them.
+    """
+    marks = [pytest.mark.xdist_group(name=f"start_method={start_method}")]
     if start_method is None:
-        mp_context = None
+        pass
     elif "mp_context" not in POOL_PARAMS:
-        raise SkipTest("mp_context is not supported in your interpreter")
+        marks.append(
+            pytest.mark.skip("mp_context is not supported in your interpreter")
+        )
     elif not is_mp_start_method_supported(start_method):
-        raise SkipTest(f"{start_method=} is not supported in your interpreter")
-    else:
-        mp_context = multiprocessing.get_context(start_method)
-    return mp_context
+        marks.append(
+            pytest.mark.skip(f"{start_method=} is not supported in your interpreter")
+        )
+    return pytest.param(start_method, marks=marks)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[_start_method_param(m) for m in (None, "fork", "forkserver", "spawn")],
+    ids=str,
+)
+def mp_context(request):
+    """
+    The `multiprocessing` context for each start method, or None for the
+    default. Being module-scoped, each context is only created once, even though
+    several tests use it.
+    """
+    start_method = request.param
+    if start_method is None:
+        return None
+    return multiprocessing.get_context(start_method)
 
 
-@pytest.mark.parametrize("start_method", (None, "fork", "forkserver", "spawn"))
-def test_start_methods(start_method):
+@pytest.fixture(scope="module")
+def get_exe(mp_context):
+    """
+    Returns a function that gives a shared 1-worker executor of the given class
+    for the current ``mp_context``. This way, the `test_pickling` cases only
+    start a new worker when a failure breaks the previous pool.
+    """
+    with ExitStack() as es:
+        exes = {}
+
+        def get(cls):
+            exe = exes.get(cls)
+            if exe is None or exe._broken:
+                exe = es.enter_context(cls(1, mp_context=mp_context))
+                exes[cls] = exe
+            return exe
+
+        yield get
+
+
+def test_start_methods(mp_context):
     # Check that our initial state is reasonable.
     fake_worker_id = -123
     assert get_worker_id() != fake_worker_id
     assert PID != fake_worker_id
     assert PID == os.getpid()
 
-    # Create the mp_context.
-    mp_context = _get_mp_context_or_skip(start_method)
-
     # Verify that the initializer ran for the worker process.
     with CpProcessPoolExecutor(
         1,
@@ -94,17 +141,27 @@ def test_max_tasks_per_child():
     # process, due to bugs in the multiprocessing library.
     NUM_SETS = 5
     NUM_TASKS_PER_SET = 1
-    with CpProcessPoolExecutor(max_tasks_per_child=NUM_TASKS_PER_SET) as exe:
-        futs = [exe.submit(get_worker_id) for _ in range(NUM_SETS * NUM_TASKS_PER_SET)]
-        counts = defaultdict(int)
-        for fut in futs:
-            counts[fut.result()] += 1
+    # Without an mp_context, max_tasks_per_child makes ProcessPoolExecutor use
+    # the "spawn" start method, so each replacement worker would start a whole
+    # new interpreter. Forking them from a forkserver is much cheaper. ("fork"
+    # itself isn't allowed with max_tasks_per_child.)
+    if is_mp_start_method_supported("forkserver"):
+        mp_context = multiprocessing.get_context("forkserver")
+    else:
+        mp_context = None
+    with CpProcessPoolExecutor(
+        max_tasks_per_child=NUM_TASKS_PER_SET, mp_context=mp_context
+    ) as exe:
+        # chunksize=1 keeps one task per call, so max_tasks_per_child counts
+        # them the same way as individual submits.
+        worker_ids = exe.map(
+            get_worker_id_of_task, range(NUM_SETS * NUM_TASKS_PER_SET), chunksize=1
+        )
+        counts = Counter(worker_ids)
         assert len(counts) == NUM_SETS
-        for pid, count in counts.items():
-            assert count == NUM_TASKS_PER_SET, (pid, count)
+        assert set(counts.values()) == {NUM_TASKS_PER_SET}, counts
 
 
-@pytest.mark.parametrize("start_method", (None, "fork", "forkserver", "spawn"))
 @pytest.mark.parametrize(
     "cls,should_succeed,func",
     (
@@ -116,7 +173,7 @@ def test_max_tasks_per_child():
         (CpProcessPoolExecutor, True, get_lambda),
     ),
 )
-def test_pickling(cls, should_succeed, func, start_method):
+def test_pickling(cls, should_succeed, func, get_exe):
     """
     Verifies that
 
@@ -127,9 +184,8 @@ def test_pickling(cls, should_succeed, func, start_method):
      - CpProcessPoolExecutor can handle bi-directional pickling that requires
        cloudpickle.
     """
-    mp_context = _get_mp_context_or_skip(start_method)
+    exe = get_exe(cls)
     with ExitStack() as es:
-        exe = es.enter_context(cls(1, mp_context=mp_context))
         if not should_succeed:
             # Trap errors from the library, not assertions from this test.
             es.enter_context(pytest.raises((AttributeError, RuntimeError, PickleError)))
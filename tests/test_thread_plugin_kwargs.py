@@ -1,8 +1,6 @@
-import inspect
 import os
 import sys
 import threading
-from concurrent.futures import ProcessPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -24,8 +22,6 @@ def get_tls_worker_id(tls):
 
 
 class TestThreadPoolKwargs(TestCase):
-    POOL_SIG = inspect.signature(ProcessPoolExecutor)
-
     def test_ignored(self):
         """
         Ensure that various the parameters that `.ExecutorCtx` is supposed to
@@ -69,11 +65,7 @@ class TestThreadPoolKwargs(TestCase):
         PREFIX = "TestThread-PYRSEUS-CTX-TTPK-TTNP"
 
         def count_threads_with_prefix():
-            count = 0
-            for thread in threading.enumerate():
-                if thread.name.startswith(PREFIX):
-                    count += 1
-            return count
+            return sum(1 for t in threading.enumerate() if t.name.startswith(PREFIX))
 
         assert count_threads_with_prefix() == 0
         with ExecutorCtx(PLUGIN_NAME, 1, thread_name_prefix=PREFIX) as exe: